@@ -3,21 +3,38 @@ GuardianDrive - FastAPI Backend
 AI-Powered Storage Health, Risk-Aware Tiering, and Automated Cloud Orchestration
 """
 
-import json
+import hashlib
+import heapq
+import operator
 import os
 import random
+import sys
+import time
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from pydantic import BaseModel
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import numpy as np
+import orjson
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; run the kernels as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
 
 # Initialize FastAPI app
 app = FastAPI(
     title="GuardianDrive API",
     description="Intelligent Storage Orchestration Platform",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -32,8 +49,8 @@ app.add_middleware(
 # Load mock data
 DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "mock_data.json")
 
-with open(DATA_PATH, "r") as f:
-    MOCK_DATA = json.load(f)
+with open(DATA_PATH, "rb") as f:
+    MOCK_DATA = orjson.loads(f.read())
 
 # ============================================================================
 # Pydantic Models
@@ -130,62 +147,111 @@ class Alert(BaseModel):
     timestamp: str
     acknowledged: bool
 
+# ============================================================================
+# Precomputed Arrays & Aggregates
+# ============================================================================
+
+# ISO-8601 parsing; Python 3.11+ accepts the trailing 'Z' natively
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value: str) -> datetime:
+        return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
+# K-means cluster centers (pre-trained): recency, frequency, size
+CLUSTER_CENTERS = np.array([
+    [0.9, 0.8, 0.3],
+    [0.6, 0.4, 0.5],
+    [0.3, 0.2, 0.7],
+    [0.1, 0.05, 0.9]
+])
+CLUSTER_NAMES = np.array(['HOT', 'WARM', 'COLD', 'ARCHIVE'])
+_CLUSTER_NAMES = tuple(CLUSTER_NAMES.tolist())
+CENTER_NORMS2 = (CLUSTER_CENTERS**2).sum(1)
+
+# O(1) lookups by id (references into MOCK_DATA, not copies)
+_DRIVE_BY_ID = {d['id']: d for d in MOCK_DATA['drives']}
+_FILE_BY_ID = {f['id']: f for f in MOCK_DATA['files']}
+_ALERT_BY_ID = {a['id']: a for a in MOCK_DATA['alerts']}
+
+# last_accessed parsed once to epoch seconds, keyed by file id
+_LAST_ACCESSED_TS = {
+    f['id']: _parse_iso(f['last_accessed']).timestamp()
+    for f in MOCK_DATA['files']
+}
+
+# Per-file feature columns over MOCK_DATA['files'] (structure of arrays)
+_last_accessed_ts = np.array([_LAST_ACCESSED_TS[f['id']] for f in MOCK_DATA['files']], dtype=np.float64)
+_access_count = np.array([f['access_count'] for f in MOCK_DATA['files']], dtype=np.int32)
+_size = np.array([f['size'] for f in MOCK_DATA['files']], dtype=np.int64)
+
+# Storage cost per GB/month, indexed like CLUSTER_NAMES
+TIER_COST = np.array([0.023, 0.0125, 0.004, 0.00099])
+_TIER_INDEX = {tier: i for i, tier in enumerate(CLUSTER_NAMES.tolist())}
+# Unrecognized tiers get index -1 so they never match a recommendation,
+# and are priced like HOT
+_current_tier_idx = np.array([_TIER_INDEX.get(f['tier'], -1) for f in MOCK_DATA['files']], dtype=np.int64)
+_current_tier_cost = np.where(_current_tier_idx >= 0, TIER_COST[_current_tier_idx], TIER_COST[_TIER_INDEX['HOT']])
+_is_critical = np.array([f['risk_level'] == 'CRITICAL' for f in MOCK_DATA['files']], dtype=bool)
+
+# Drive health flags behind the tiering plan overrides
+_HAS_UNHEALTHY = any(d['health_score'] < 50 for d in MOCK_DATA['drives'])
+_ANY_DRIVE_FAILING = any(d['health_score'] < 40 for d in MOCK_DATA['drives'])
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def format_bytes(size_bytes: int) -> str:
     """Convert bytes to human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} PB"
+    # floor(log2(size)) // 10 selects the 1024-power unit without looping
+    idx = min(len(_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10) if size_bytes >= 1 else 0
+    return f"{size_bytes / (1024**idx):.2f} {_UNITS[idx]}"
+
+@njit(fastmath=True)
+def _health_score_njit(reallocated: float, seek_error: float, power_on: float,
+                       read_error: float, udma: float) -> float:
+    """Weighted SMART attribute scoring kernel (JIT-compiled when numba is available)"""
+    # Feature weights (simulating trained XGBoost model)
+    score = 100.0
+    score += -0.35 * min(reallocated * 2.0, 50.0)     # reallocated_sector_ct
+    score += -0.25 * (100.0 - seek_error)              # seek_error_rate
+    score += -0.15 * min(power_on / 1000.0, 30.0)      # power_on_hours
+    score += -0.15 * min(read_error / 10.0, 30.0)      # raw_read_error_rate
+    score += -0.10 * min(udma * 5.0, 25.0)             # udma_crc_errors
+    
+    return max(0.0, min(100.0, score))
+
+# Warm up the kernel so the first request doesn't pay the JIT compile cost
+_health_score_njit(0.0, 100.0, 0.0, 0.0, 0.0)
 
 def calculate_health_score(smart_data: Dict) -> float:
     """
     ML-based health score calculation using weighted SMART attributes
     Simulates XGBoost inference
     """
-    # Feature weights (simulating trained XGBoost model)
-    weights = {
-        'reallocated_sector_ct': -0.35,
-        'seek_error_rate': -0.25,
-        'power_on_hours': -0.15,
-        'raw_read_error_rate': -0.15,
-        'udma_crc_errors': -0.10
-    }
-    
-    score = 100.0
-    
-    # Apply feature weights
-    reallocated = smart_data.get('reallocated_sector_ct', 0)
-    score += weights['reallocated_sector_ct'] * min(reallocated * 2, 50)
-    
-    seek_error = 100 - smart_data.get('seek_error_rate', 100)
-    score += weights['seek_error_rate'] * seek_error
-    
-    power_on = smart_data.get('power_on_hours', 0)
-    score += weights['power_on_hours'] * min(power_on / 1000, 30)
-    
-    read_error = smart_data.get('raw_read_error_rate', 0)
-    score += weights['raw_read_error_rate'] * min(read_error / 10, 30)
-    
-    udma_errors = smart_data.get('udma_crc_errors', 0)
-    score += weights['udma_crc_errors'] * min(udma_errors * 5, 25)
-    
-    return max(0, min(100, score))
+    return _health_score_njit(
+        float(smart_data.get('reallocated_sector_ct', 0)),
+        float(smart_data.get('seek_error_rate', 100)),
+        float(smart_data.get('power_on_hours', 0)),
+        float(smart_data.get('raw_read_error_rate', 0)),
+        float(smart_data.get('udma_crc_errors', 0))
+    )
+
+# Lower bounds of the HIGH, MEDIUM and LOW bands
+_RISK_BOUNDS = np.array([40, 60, 80])
+_RISK_NAMES = np.array(['CRITICAL', 'HIGH', 'MEDIUM', 'LOW'])
 
 def get_risk_level(health_score: float) -> str:
     """Convert health score to risk level"""
-    if health_score >= 80:
-        return "LOW"
-    elif health_score >= 60:
-        return "MEDIUM"
-    elif health_score >= 40:
-        return "HIGH"
-    else:
-        return "CRITICAL"
+    return str(_RISK_NAMES[np.searchsorted(_RISK_BOUNDS, health_score, side='right')])
+
+def get_risk_levels(health_scores: np.ndarray) -> np.ndarray:
+    """Convert an array of health scores to risk levels in one pass"""
+    return _RISK_NAMES[np.searchsorted(_RISK_BOUNDS, health_scores, side='right')]
 
 def predict_failure_days(health_score: float, smart_data: Dict) -> Optional[int]:
     """Predict days until failure based on health metrics"""
@@ -211,13 +277,21 @@ def predict_failure_days(health_score: float, smart_data: Dict) -> Optional[int]
     
     return predicted_days
 
-def classify_access_pattern(file_data: Dict) -> Dict:
+def classify_access_pattern(file_data: Dict, now_ts: Optional[float] = None) -> Dict:
     """
     K-means clustering simulation for access pattern classification
     Returns tier classification and confidence
     """
+    if now_ts is None:
+        now_ts = time.time()
+    
+    # Use the timestamp parsed at load time, parsing only for unknown files
+    last_accessed_ts = _LAST_ACCESSED_TS.get(file_data['id'])
+    if last_accessed_ts is None:
+        last_accessed_ts = _parse_iso(file_data['last_accessed']).timestamp()
+    
     # Extract features
-    days_since_access = (datetime.now() - datetime.fromisoformat(file_data['last_accessed'].replace('Z', '+00:00'))).days
+    days_since_access = (now_ts - last_accessed_ts) // 86400
     access_count = file_data['access_count']
     size_gb = file_data['size'] / (1024**3)
     
@@ -226,30 +300,13 @@ def classify_access_pattern(file_data: Dict) -> Dict:
     frequency_score = min(1, access_count / 1000)
     size_normalized = min(1, size_gb / 10)
     
-    # K-means cluster centers (pre-trained)
-    clusters = {
-        'HOT': {'recency': 0.9, 'frequency': 0.8, 'size': 0.3},
-        'WARM': {'recency': 0.6, 'frequency': 0.4, 'size': 0.5},
-        'COLD': {'recency': 0.3, 'frequency': 0.2, 'size': 0.7},
-        'ARCHIVE': {'recency': 0.1, 'frequency': 0.05, 'size': 0.9}
-    }
+    # Distances to each pre-trained cluster center
+    feat = np.array([recency_score, frequency_score, size_normalized])
+    dists = np.linalg.norm(CLUSTER_CENTERS - feat, axis=1)
+    idx = int(dists.argmin())
+    best_tier = _CLUSTER_NAMES[idx]
     
-    # Calculate distances to each cluster
-    min_distance = float('inf')
-    best_tier = 'COLD'
-    
-    for tier, center in clusters.items():
-        distance = (
-            (recency_score - center['recency'])**2 +
-            (frequency_score - center['frequency'])**2 +
-            (size_normalized - center['size'])**2
-        ) ** 0.5
-        
-        if distance < min_distance:
-            min_distance = distance
-            best_tier = tier
-    
-    confidence = max(0, min(1, 1 - min_distance))
+    confidence = max(0, min(1, 1 - float(dists[idx])))
     
     return {
         'tier': best_tier,
@@ -258,23 +315,61 @@ def classify_access_pattern(file_data: Dict) -> Dict:
         'frequency_score': round(frequency_score, 2)
     }
 
+def classify_access_pattern_bulk(now_ts: Optional[float] = None) -> Dict[str, np.ndarray]:
+    """
+    Vectorized access pattern classification over all files in MOCK_DATA
+    Returns per-file cluster indices into CLUSTER_NAMES with confidence and scores
+    """
+    if now_ts is None:
+        now_ts = time.time()
+    
+    # Extract and normalize features for every file at once
+    days_since_access = np.floor((now_ts - _last_accessed_ts) / 86400)
+    recency_score = np.maximum(0, 1 - days_since_access / 365)
+    frequency_score = np.minimum(1, _access_count / 1000)
+    size_normalized = np.minimum(1, _size / (10 * 1024**3))
+    
+    # Squared distances via ||a-b||^2 = ||a||^2 + ||b||^2 - 2a.b (one matmul)
+    feats = np.column_stack((recency_score, frequency_score, size_normalized))
+    feats_norm2 = (feats**2).sum(1, keepdims=True)
+    cross = feats @ CLUSTER_CENTERS.T
+    dists2 = feats_norm2 + CENTER_NORMS2[None, :] - 2 * cross
+    tier_idx = dists2.argmin(axis=1)
+    
+    # sqrt is monotonic, so only the winning distance needs it
+    min_distance = np.sqrt(np.maximum(dists2[np.arange(len(tier_idx)), tier_idx], 0))
+    confidence = np.clip(1 - min_distance, 0, 1)
+    
+    return {
+        'tier': tier_idx,
+        'confidence': np.round(confidence, 2),
+        'recency_score': np.round(recency_score, 2),
+        'frequency_score': np.round(frequency_score, 2)
+    }
+
+# Expected size reduction by file extension
+_TYPE_COMPRESSIBILITY = {
+    'txt': 0.75, 'csv': 0.72, 'json': 0.70, 'sql': 0.68, 'log': 0.80,
+    'xml': 0.78, 'yaml': 0.60, 'html': 0.65,
+    'pdf': 0.40, 'docx': 0.35, 'xlsx': 0.30, 'pptx': 0.25,
+    'jpg': 0.02, 'jpeg': 0.02, 'png': 0.03, 'mp4': 0.02, 
+    'zip': 0.01, 'gz': 0.01, 'tar': 0.05,
+    'exe': 0.08, 'bin': 0.10, 'apk': 0.08,
+    'pkl': 0.15, 'parquet': 0.55, 'pbix': 0.20,
+    'fig': 0.10, 'pcap': 0.45, 'pst': 0.20
+}
+
 def calculate_compression_benefit(file_data: Dict) -> Dict:
     """
     Heuristic-based compression optimizer
     """
-    type_compressibility = {
-        'txt': 0.75, 'csv': 0.72, 'json': 0.70, 'sql': 0.68, 'log': 0.80,
-        'xml': 0.78, 'yaml': 0.60, 'html': 0.65,
-        'pdf': 0.40, 'docx': 0.35, 'xlsx': 0.30, 'pptx': 0.25,
-        'jpg': 0.02, 'jpeg': 0.02, 'png': 0.03, 'mp4': 0.02, 
-        'zip': 0.01, 'gz': 0.01, 'tar': 0.05,
-        'exe': 0.08, 'bin': 0.10, 'apk': 0.08,
-        'pkl': 0.15, 'parquet': 0.55, 'pbix': 0.20,
-        'fig': 0.10, 'pcap': 0.45, 'pst': 0.20
-    }
-    
-    ext = file_data['extension'].lower()
-    benefit = type_compressibility.get(ext, 0.15)
+    # Copy so callers can't mutate the memoized result
+    return dict(_compression_benefit(file_data['extension'].lower(), file_data['size']))
+
+@lru_cache(maxsize=4096)
+def _compression_benefit(ext: str, current_size: int) -> Dict:
+    """Pure compression analysis core, memoized on (extension, size)"""
+    benefit = _TYPE_COMPRESSIBILITY.get(ext, 0.15)
     
     # If already compressed or low benefit, don't recommend
     if benefit < 0.20:
@@ -296,7 +391,6 @@ def calculate_compression_benefit(file_data: Dict) -> Dict:
         speed_factor = 2.0
     
     # Calculate sizes
-    current_size = file_data['size']
     compressed_size = int(current_size * (1 - benefit))
     
     # Cost analysis (₹2/hour compute, ₹0.023/GB/month storage)
@@ -327,10 +421,46 @@ def calculate_compression_benefit(file_data: Dict) -> Dict:
         'reason': f'High compressibility ({benefit*100:.0f}%) with ROI {roi_score:.1f}x'
     }
 
-def get_cloud_options(tier: str, size_gb: float) -> List[CloudOption]:
-    """Get cloud storage options for a given tier"""
+# Shared per-file analysis for /api/tiering-plan and /api/compression.
+# Access recency is day-granular, so a short TTL keeps it fresh enough.
+_FILE_ANALYSIS_CACHE: Optional[Dict[str, Any]] = None
+_FILE_ANALYSIS_TTL = 3600  # seconds
+
+def get_file_analysis() -> Dict[str, Any]:
+    """
+    Access pattern and compression analysis for every file, computed in one pass
+    Built lazily on first request and reused until the TTL expires
+    """
+    global _FILE_ANALYSIS_CACHE
+    
+    now_ts = time.time()
+    if _FILE_ANALYSIS_CACHE is not None and now_ts - _FILE_ANALYSIS_CACHE['built_at'] < _FILE_ANALYSIS_TTL:
+        return _FILE_ANALYSIS_CACHE
+    
+    files = MOCK_DATA['files']
+    access_info = classify_access_pattern_bulk(now_ts)
+    compression_info = [_compression_benefit(f['extension'].lower(), f['size']) for f in files]
+    
+    _FILE_ANALYSIS_CACHE = {
+        'built_at': now_ts,
+        'access_tier': access_info['tier'],
+        'access_confidence': access_info['confidence'],
+        'recency_score': access_info['recency_score'],
+        'frequency_score': access_info['frequency_score'],
+        'comp_recommend': np.array([c['recommend'] for c in compression_info], dtype=bool),
+        'comp_ratio': np.array([c['compression_ratio'] for c in compression_info], dtype=np.float64),
+        'comp_algorithm': np.array([c.get('algorithm', '') for c in compression_info]),
+        'comp_roi': np.array([c.get('roi_score', 0.0) for c in compression_info], dtype=np.float64),
+        'comp_size': np.array([c.get('compressed_size', f['size']) for c, f in zip(compression_info, files)], dtype=np.int64),
+        'comp_savings': np.array([c.get('monthly_savings', 0.0) for c in compression_info], dtype=np.float64),
+        'comp_minutes': np.array([c.get('compression_time_minutes', 0) for c in compression_info], dtype=np.int64)
+    }
+    return _FILE_ANALYSIS_CACHE
+
+def _build_cloud_templates() -> Dict[str, List[Tuple[str, str, float, float, str, float]]]:
+    """Precompute per-tier provider rows priced in INR against AWS standard"""
     pricing = MOCK_DATA['cloud_pricing']
-    options = []
+    baseline = pricing['aws']['standard']
     
     tier_mapping = {
         'HOT': [
@@ -355,38 +485,63 @@ def get_cloud_options(tier: str, size_gb: float) -> List[CloudOption]:
         ]
     }
     
-    for provider, cloud_tier, cost_per_gb, retrieval in tier_mapping.get(tier, tier_mapping['COLD']):
+    return {
+        tier: [
+            (
+                provider.upper(),
+                cloud_tier,
+                cost_per_gb,
+                round(cost_per_gb * 83, 2),  # Convert to INR
+                retrieval,
+                round((1 - cost_per_gb / baseline) * 100, 1)
+            )
+            for provider, cloud_tier, cost_per_gb, retrieval in rows
+        ]
+        for tier, rows in tier_mapping.items()
+    }
+
+_CLOUD_TEMPLATES = _build_cloud_templates()
+
+def get_cloud_options(tier: str, size_gb: float) -> List[CloudOption]:
+    """Get cloud storage options for a given tier"""
+    options = []
+    
+    for provider, cloud_tier, cost_per_gb, cost_inr, retrieval, savings in _CLOUD_TEMPLATES.get(tier, _CLOUD_TEMPLATES['COLD']):
         total_cost = size_gb * cost_per_gb * 83  # Convert to INR
-        options.append(CloudOption(
-            provider=provider.upper(),
+        options.append(CloudOption.model_construct(
+            provider=provider,
             tier=cloud_tier,
-            monthly_cost_per_gb=round(cost_per_gb * 83, 2),
+            monthly_cost_per_gb=cost_inr,
             retrieval_time=retrieval,
             total_cost=round(total_cost, 2),
-            savings_percent=round((1 - cost_per_gb / pricing['aws']['standard']) * 100, 1)
+            savings_percent=savings
         ))
     
-    return sorted(options, key=lambda x: x.total_cost)
+    options.sort(key=operator.attrgetter('total_cost'))
+    return options
+
+# Scalarization weights (cost, risk, latency, user) per risk tolerance
+_WEIGHTS_BY_TOLERANCE = {
+    'conservative': np.array([0.30, 0.30, 0.20, 0.10]),
+    'balanced': np.array([0.35, 0.25, 0.15, 0.15]),
+    'aggressive': np.array([0.40, 0.20, 0.15, 0.10])
+}
+# Weights for any other risk_tolerance string
+_FALLBACK_WEIGHTS = np.array([0.35, 0.20, 0.15, 0.10])
 
 def weighted_scalarization_optimization(
     cost: float,
     risk: float,
     latency: float,
     user_pref: float,
-    weights: Dict[str, float]
+    weights: np.ndarray
 ) -> float:
     """
     Risk-Cost Trade-off Optimizer using Weighted Scalarization
     Score = w1*cost + w2*risk + w3*latency + w4*user_pref
     Lower score is better
     """
-    score = (
-        weights.get('cost', 0.40) * cost +
-        weights.get('risk', 0.35) * risk +
-        weights.get('latency', 0.15) * latency +
-        weights.get('user', 0.10) * user_pref
-    )
-    return score
+    return float(weights @ np.array([cost, risk, latency, user_pref]))
 
 def generate_tiering_strategies(
     files: List[Dict],
@@ -397,10 +552,17 @@ def generate_tiering_strategies(
     
     # Calculate base metrics
     total_size_gb = sum(f['size'] for f in files) / (1024**3)
-    critical_files = sum(1 for f in files if f['risk_level'] == 'CRITICAL')
     
+    return list(_score_strategies(risk_tolerance, total_size_gb))
+
+@lru_cache(maxsize=64)
+def _score_strategies(risk_tolerance: str, total_size_gb: float) -> Tuple[StrategyOption, ...]:
+    """Strategy scoring core; strategy metadata is static, so memoize per input"""
     strategies = []
     
+    # Weights depend only on risk tolerance
+    weights = _WEIGHTS_BY_TOLERANCE.get(risk_tolerance, _FALLBACK_WEIGHTS)
+    
     for strategy_key, strategy_data in MOCK_DATA['tiering_strategies'].items():
         # Calculate normalized metrics
         cost_normalized = strategy_data['cost_multiplier']
@@ -409,13 +571,6 @@ def generate_tiering_strategies(
         user_pref = 0.5  # Neutral user preference
         
         # Apply weighted scalarization
-        weights = {
-            'cost': 0.40 if risk_tolerance == 'aggressive' else (0.30 if risk_tolerance == 'conservative' else 0.35),
-            'risk': 0.30 if risk_tolerance == 'conservative' else (0.25 if risk_tolerance == 'balanced' else 0.20),
-            'latency': 0.20 if risk_tolerance == 'conservative' else 0.15,
-            'user': 0.15 if risk_tolerance == 'balanced' else 0.10
-        }
-        
         score = weighted_scalarization_optimization(
             cost_normalized,
             risk_normalized,
@@ -437,7 +592,165 @@ def generate_tiering_strategies(
             compression_level=strategy_data['compression']
         ))
     
-    return sorted(strategies, key=lambda x: x.score)
+    return tuple(sorted(strategies, key=lambda x: x.score))
+
+# Strategy options for every known risk tolerance over the static file set
+_TOTAL_SIZE_GB = sum(f['size'] for f in MOCK_DATA['files']) / (1024**3)
+_STRATEGY_CACHE = {
+    risk_tolerance: generate_tiering_strategies(MOCK_DATA['files'], MOCK_DATA['drives'], risk_tolerance)
+    for risk_tolerance in _WEIGHTS_BY_TOLERANCE
+}
+
+def _build_dashboard_cache() -> Dict[str, Any]:
+    """Aggregate the static drive/file statistics served by /api/dashboard"""
+    drives = MOCK_DATA['drives']
+    files = MOCK_DATA['files']
+    
+    caps = np.fromiter((d['capacity'] for d in drives), dtype=np.int64)
+    used = np.fromiter((d['used'] for d in drives), dtype=np.int64)
+    healths = np.fromiter((d['health_score'] for d in drives), dtype=np.float64)
+    
+    risk_levels, risk_counts = np.unique(get_risk_levels(healths), return_counts=True)
+    risk_histogram = dict(zip(risk_levels.tolist(), risk_counts.tolist()))
+    critical_drives = risk_histogram.get('CRITICAL', 0)
+    high_risk_drives = risk_histogram.get('HIGH', 0)
+    
+    # Tier distribution
+    tier_counts = Counter(f['tier'] for f in files)
+    tier_sizes = Counter()
+    for file in files:
+        tier_sizes[file['tier']] += file['size']
+    
+    total_capacity = int(caps.sum())
+    total_used = int(used.sum())
+    
+    return {
+        "storage_summary": {
+            "total_capacity_gb": total_capacity,
+            "total_used_gb": total_used,
+            "utilization_percent": round(total_used / total_capacity * 100, 1),
+            "total_files": len(files)
+        },
+        "health_summary": {
+            "average_health_score": round(float(healths.mean()), 1),
+            "critical_drives": critical_drives,
+            "high_risk_drives": high_risk_drives,
+            "healthy_drives": len(drives) - critical_drives - high_risk_drives
+        },
+        "tier_distribution": {
+            tier: {
+                "files": count,
+                "size_gb": round(tier_sizes[tier] / (1024**3), 2)
+            }
+            for tier, count in tier_counts.items()
+        },
+        "cost_summary": MOCK_DATA['cost_projections']
+    }
+
+# Drives and files are static for the demo; only alert state changes at runtime
+_DASHBOARD_CACHE = _build_dashboard_cache()
+
+# ============================================================================
+# Serialized Response Cache
+# ============================================================================
+
+def _json_payload(payload: Any) -> Tuple[bytes, str]:
+    """Serialize a payload once with orjson and derive its ETag"""
+    content = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return content, '"' + hashlib.blake2b(content, digest_size=16).hexdigest() + '"'
+
+def _json_response(request: Request, cached: Tuple[bytes, str]) -> Response:
+    """Serve pre-serialized JSON, answering 304 when the client's ETag still matches"""
+    content, etag = cached
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
+
+_DRIVES_JSON = _json_payload(MOCK_DATA['drives'])
+
+@lru_cache(maxsize=32)
+def _files_json(tier: Optional[str]) -> Tuple[bytes, str]:
+    """Serialized file list, optionally filtered by tier"""
+    files = MOCK_DATA['files']
+    
+    if tier:
+        files = [f for f in files if f['tier'] == tier]
+    
+    return _json_payload(files)
+
+# Alert-backed payloads are cleared by acknowledge_alert
+@lru_cache(maxsize=32)
+def _alerts_json(severity: Optional[str]) -> Tuple[bytes, str]:
+    """Serialized alert list, optionally filtered by severity"""
+    alerts = MOCK_DATA['alerts']
+    
+    if severity:
+        alerts = [a for a in alerts if a['severity'] == severity]
+    
+    return _json_payload(alerts)
+
+@lru_cache(maxsize=1)
+def _dashboard_json() -> Tuple[bytes, str]:
+    """Serialized dashboard: static aggregates plus current alert state"""
+    # Recent alerts
+    unacknowledged_alerts = [a for a in MOCK_DATA['alerts'] if not a['acknowledged']]
+    severity_counts = Counter(a['severity'] for a in unacknowledged_alerts)
+    
+    return _json_payload({
+        **_DASHBOARD_CACHE,
+        "alerts": {
+            "total": len(unacknowledged_alerts),
+            "critical": severity_counts['critical'],
+            "high": severity_counts['high'],
+            "items": unacknowledged_alerts
+        }
+    })
+
+@lru_cache(maxsize=32)
+def _lifecycle_json(provider: str) -> Tuple[bytes, str]:
+    """Serialized lifecycle policy for a cloud provider"""
+    if provider.lower() == "aws":
+        policy = {
+            "Rules": [
+                {
+                    "ID": "GuardianDrive-HotToWarm",
+                    "Status": "Enabled",
+                    "Filter": {"Prefix": ""},
+                    "Transitions": [
+                        {
+                            "Days": 30,
+                            "StorageClass": "INTELLIGENT_TIERING"
+                        }
+                    ]
+                },
+                {
+                    "ID": "GuardianDrive-WarmToCold",
+                    "Status": "Enabled",
+                    "Filter": {"Prefix": "archive/"},
+                    "Transitions": [
+                        {
+                            "Days": 90,
+                            "StorageClass": "GLACIER_IR"
+                        }
+                    ]
+                },
+                {
+                    "ID": "GuardianDrive-ColdToDeep",
+                    "Status": "Enabled",
+                    "Filter": {"Prefix": "deep-archive/"},
+                    "Transitions": [
+                        {
+                            "Days": 365,
+                            "StorageClass": "DEEP_ARCHIVE"
+                        }
+                    ]
+                }
+            ]
+        }
+    else:
+        policy = {"message": f"Lifecycle policy for {provider} not yet implemented"}
+    
+    return _json_payload(policy)
 
 # ============================================================================
 # API Endpoints
@@ -452,144 +765,140 @@ async def root():
     }
 
 @app.get("/api/drives", response_model=List[Drive])
-async def get_drives():
+async def get_drives(request: Request):
     """Get all drives with health metrics"""
-    return MOCK_DATA['drives']
+    return _json_response(request, _DRIVES_JSON)
 
 @app.get("/api/drives/{drive_id}")
 async def get_drive(drive_id: str):
     """Get specific drive details"""
-    for drive in MOCK_DATA['drives']:
-        if drive['id'] == drive_id:
-            return drive
-    raise HTTPException(status_code=404, detail="Drive not found")
+    drive = _DRIVE_BY_ID.get(drive_id)
+    if drive is None:
+        raise HTTPException(status_code=404, detail="Drive not found")
+    return drive
 
 @app.get("/api/drives/{drive_id}/health")
 async def get_drive_health(drive_id: str):
     """Get detailed health analysis for a drive"""
-    for drive in MOCK_DATA['drives']:
-        if drive['id'] == drive_id:
-            # Recalculate health using ML model simulation
-            health_score = calculate_health_score(drive['smart_data'])
-            risk_level = get_risk_level(health_score)
-            predicted_failure = predict_failure_days(health_score, drive['smart_data'])
-            
-            return {
-                "drive_id": drive_id,
-                "health_score": round(health_score, 1),
-                "risk_level": risk_level,
-                "predicted_failure_days": predicted_failure,
-                "confidence": 0.92,
-                "top_factors": [
-                    {"factor": "Reallocated Sectors", "impact": drive['reallocated_sectors'] * 0.35},
-                    {"factor": "Power-On Hours", "impact": min(drive['power_on_hours'] / 100000, 0.25)},
-                    {"factor": "Read Error Rate", "impact": (100 - drive['read_error_rate']) / 100 * 0.25}
-                ],
-                "recommendations": [
-                    "Schedule backup within 7 days" if health_score < 50 else "Monitor closely",
-                    "Enable cloud sync for critical files" if health_score < 70 else "Standard monitoring",
-                    "Consider drive replacement" if health_score < 40 else "No immediate action needed"
-                ]
-            }
-    raise HTTPException(status_code=404, detail="Drive not found")
+    drive = _DRIVE_BY_ID.get(drive_id)
+    if drive is None:
+        raise HTTPException(status_code=404, detail="Drive not found")
+    
+    # Recalculate health using ML model simulation
+    health_score = calculate_health_score(drive['smart_data'])
+    risk_level = get_risk_level(health_score)
+    predicted_failure = predict_failure_days(health_score, drive['smart_data'])
+    
+    return {
+        "drive_id": drive_id,
+        "health_score": round(health_score, 1),
+        "risk_level": risk_level,
+        "predicted_failure_days": predicted_failure,
+        "confidence": 0.92,
+        "top_factors": [
+            {"factor": "Reallocated Sectors", "impact": drive['reallocated_sectors'] * 0.35},
+            {"factor": "Power-On Hours", "impact": min(drive['power_on_hours'] / 100000, 0.25)},
+            {"factor": "Read Error Rate", "impact": (100 - drive['read_error_rate']) / 100 * 0.25}
+        ],
+        "recommendations": [
+            "Schedule backup within 7 days" if health_score < 50 else "Monitor closely",
+            "Enable cloud sync for critical files" if health_score < 70 else "Standard monitoring",
+            "Consider drive replacement" if health_score < 40 else "No immediate action needed"
+        ]
+    }
 
 @app.get("/api/files", response_model=List[File])
-async def get_files(tier: Optional[str] = None, drive_id: Optional[str] = None):
+async def get_files(request: Request, tier: Optional[str] = None, drive_id: Optional[str] = None):
     """Get all files with optional filtering"""
-    files = MOCK_DATA['files']
-    
-    if tier:
-        files = [f for f in files if f['tier'] == tier.upper()]
-    
-    return files
+    return _json_response(request, _files_json(tier.upper() if tier else None))
 
 @app.get("/api/files/{file_id}")
 async def get_file(file_id: str):
     """Get specific file details"""
-    for file in MOCK_DATA['files']:
-        if file['id'] == file_id:
-            # Add access pattern analysis
-            access_analysis = classify_access_pattern(file)
-            compression_analysis = calculate_compression_benefit(file)
-            
-            return {
-                **file,
-                "access_analysis": access_analysis,
-                "compression_analysis": compression_analysis,
-                "size_formatted": format_bytes(file['size'])
-            }
-    raise HTTPException(status_code=404, detail="File not found")
+    file = _FILE_BY_ID.get(file_id)
+    if file is None:
+        raise HTTPException(status_code=404, detail="File not found")
+    
+    # Add access pattern analysis
+    access_analysis = classify_access_pattern(file)
+    compression_analysis = calculate_compression_benefit(file)
+    
+    return {
+        **file,
+        "access_analysis": access_analysis,
+        "compression_analysis": compression_analysis,
+        "size_formatted": format_bytes(file['size'])
+    }
 
 @app.post("/api/tiering-plan")
 async def create_tiering_plan(request: TieringPlanRequest):
     """Generate intelligent tiering recommendations"""
     
+    files = MOCK_DATA['files']
     recommendations = []
-    total_savings = 0
     
-    for file in MOCK_DATA['files']:
-        # Get access pattern classification
-        access_info = classify_access_pattern(file)
-        
-        # Determine recommended tier
-        current_tier = file['tier']
-        recommended_tier = access_info['tier']
-        
-        # Override based on drive health
-        file_drive = None
-        for drive in MOCK_DATA['drives']:
-            if drive['health_score'] < 50 and file['risk_level'] == 'CRITICAL':
-                recommended_tier = 'HOT'  # Move critical files from failing drives
-                break
-        
-        if current_tier != recommended_tier:
-            size_gb = file['size'] / (1024**3)
-            
-            # Calculate cost delta
-            tier_costs = {'HOT': 0.023, 'WARM': 0.0125, 'COLD': 0.004, 'ARCHIVE': 0.00099}
-            current_cost = size_gb * tier_costs.get(current_tier, 0.023)
-            new_cost = size_gb * tier_costs.get(recommended_tier, 0.023)
-            savings = (current_cost - new_cost) * 83  # Convert to INR
-            
-            # Determine urgency
-            if file['risk_level'] == 'CRITICAL' and any(d['health_score'] < 40 for d in MOCK_DATA['drives']):
-                urgency = "IMMEDIATE"
-            elif access_info['confidence'] > 0.8:
-                urgency = "7_DAYS"
-            else:
-                urgency = "30_DAYS"
-            
-            recommendations.append(TieringRecommendation(
-                file_id=file['id'],
-                file_name=file['name'],
-                current_tier=current_tier,
-                recommended_tier=recommended_tier,
-                recommended_cloud="AWS S3 " + recommended_tier,
-                estimated_savings=round(savings, 2),
-                migration_urgency=urgency,
-                reason=f"Access pattern: {access_info['frequency_score']*100:.0f}% frequency, {access_info['recency_score']*100:.0f}% recency",
-                confidence=access_info['confidence']
-            ))
-            
-            total_savings += savings
-    
-    # Generate strategy options
-    strategies = generate_tiering_strategies(
-        MOCK_DATA['files'],
-        MOCK_DATA['drives'],
-        request.risk_tolerance
+    # Access pattern classification for all files (shared, cached)
+    analysis = get_file_analysis()
+    
+    # Override based on drive health: move critical files from failing drives
+    recommended_idx = np.where(_HAS_UNHEALTHY & _is_critical, _TIER_INDEX['HOT'], analysis['access_tier'])
+    
+    # Calculate cost delta for every file (converted to INR)
+    savings = (_current_tier_cost - TIER_COST[recommended_idx]) * _size / (1024**3) * 83
+    
+    # Determine urgency
+    urgency = np.where(
+        _is_critical & _ANY_DRIVE_FAILING,
+        "IMMEDIATE",
+        np.where(analysis['access_confidence'] > 0.8, "7_DAYS", "30_DAYS")
     )
     
+    migrate = np.flatnonzero(_current_tier_idx != recommended_idx)
+    total_savings = float(savings[migrate].sum())
+    
+    recommended_tiers = CLUSTER_NAMES[recommended_idx].tolist()
+    savings_list = savings.tolist()
+    urgency_list = urgency.tolist()
+    confidences = analysis['access_confidence'].tolist()
+    recency_scores = analysis['recency_score'].tolist()
+    frequency_scores = analysis['frequency_score'].tolist()
+    
+    # Fields come from already-typed arrays, so skip per-item Pydantic validation
+    for i in migrate.tolist():
+        file = files[i]
+        recommended_tier = recommended_tiers[i]
+        
+        recommendations.append(TieringRecommendation.model_construct(
+            file_id=file['id'],
+            file_name=file['name'],
+            current_tier=file['tier'],
+            recommended_tier=recommended_tier,
+            recommended_cloud="AWS S3 " + recommended_tier,
+            estimated_savings=round(savings_list[i], 2),
+            migration_urgency=urgency_list[i],
+            reason=f"Access pattern: {frequency_scores[i]*100:.0f}% frequency, {recency_scores[i]*100:.0f}% recency",
+            confidence=confidences[i]
+        ))
+    
+    # Tier transitions of the migrating files, for the summary counts
+    moved_from = _current_tier_idx[migrate]
+    moved_to = recommended_idx[migrate]
+    
+    # Strategy options (precomputed for known tolerances, memoized otherwise)
+    strategies = _STRATEGY_CACHE.get(request.risk_tolerance)
+    if strategies is None:
+        strategies = list(_score_strategies(request.risk_tolerance, _TOTAL_SIZE_GB))
+    
     return {
         "total_recommendations": len(recommendations),
         "total_estimated_savings": round(total_savings, 2),
-        "recommendations": sorted(recommendations, key=lambda x: x.estimated_savings, reverse=True)[:20],
+        "recommendations": heapq.nlargest(20, recommendations, key=operator.attrgetter('estimated_savings')),
         "strategy_options": strategies,
         "summary": {
-            "hot_to_warm": sum(1 for r in recommendations if r.current_tier == 'HOT' and r.recommended_tier == 'WARM'),
-            "warm_to_cold": sum(1 for r in recommendations if r.current_tier == 'WARM' and r.recommended_tier == 'COLD'),
-            "cold_to_archive": sum(1 for r in recommendations if r.current_tier == 'COLD' and r.recommended_tier == 'ARCHIVE'),
-            "critical_migrations": sum(1 for r in recommendations if r.migration_urgency == 'IMMEDIATE')
+            "hot_to_warm": int(((moved_from == _TIER_INDEX['HOT']) & (moved_to == _TIER_INDEX['WARM'])).sum()),
+            "warm_to_cold": int(((moved_from == _TIER_INDEX['WARM']) & (moved_to == _TIER_INDEX['COLD'])).sum()),
+            "cold_to_archive": int(((moved_from == _TIER_INDEX['COLD']) & (moved_to == _TIER_INDEX['ARCHIVE'])).sum()),
+            "critical_migrations": int((urgency[migrate] == "IMMEDIATE").sum())
         }
     }
 
@@ -597,35 +906,45 @@ async def create_tiering_plan(request: TieringPlanRequest):
 async def get_compression_recommendations(min_roi: float = 1.5):
     """Get compression optimization recommendations"""
     
+    files = MOCK_DATA['files']
     recommendations = []
-    total_savings = 0
-    total_size_reduction = 0
     
-    for file in MOCK_DATA['files']:
-        compression_info = calculate_compression_benefit(file)
+    # Compression analysis for all files (shared, cached)
+    analysis = get_file_analysis()
+    
+    selected = np.flatnonzero(analysis['comp_recommend'] & (analysis['comp_roi'] >= min_roi))
+    total_savings = float(analysis['comp_savings'][selected].sum())
+    total_size_reduction = int((_size[selected] - analysis['comp_size'][selected]).sum())
+    
+    compressed_sizes = analysis['comp_size'].tolist()
+    ratios = analysis['comp_ratio'].tolist()
+    algorithms = analysis['comp_algorithm'].tolist()
+    monthly_savings = analysis['comp_savings'].tolist()
+    minutes = analysis['comp_minutes'].tolist()
+    roi_scores = analysis['comp_roi'].tolist()
+    
+    # Fields come from already-typed arrays, so skip per-item Pydantic validation
+    for i in selected.tolist():
+        file = files[i]
         
-        if compression_info.get('recommend', False) and compression_info.get('roi_score', 0) >= min_roi:
-            recommendations.append(CompressionRecommendation(
-                file_id=file['id'],
-                file_name=file['name'],
-                current_size=file['size'],
-                compressed_size=compression_info['compressed_size'],
-                compression_ratio=compression_info['compression_ratio'],
-                algorithm=compression_info['algorithm'],
-                monthly_savings=compression_info['monthly_savings'],
-                compression_time=compression_info['compression_time_minutes'],
-                roi_score=compression_info['roi_score'],
-                recommend=True
-            ))
-            
-            total_savings += compression_info['monthly_savings']
-            total_size_reduction += file['size'] - compression_info['compressed_size']
+        recommendations.append(CompressionRecommendation.model_construct(
+            file_id=file['id'],
+            file_name=file['name'],
+            current_size=file['size'],
+            compressed_size=compressed_sizes[i],
+            compression_ratio=ratios[i],
+            algorithm=algorithms[i],
+            monthly_savings=monthly_savings[i],
+            compression_time=minutes[i],
+            roi_score=roi_scores[i],
+            recommend=True
+        ))
     
     return {
         "total_recommendations": len(recommendations),
         "total_monthly_savings": round(total_savings, 2),
         "total_size_reduction": format_bytes(total_size_reduction),
-        "recommendations": sorted(recommendations, key=lambda x: x.roi_score, reverse=True)[:15]
+        "recommendations": heapq.nlargest(15, recommendations, key=operator.attrgetter('roi_score'))
     }
 
 @app.get("/api/cloud-options")
@@ -634,78 +953,25 @@ async def get_cloud_options_endpoint(tier: str = "COLD", size_gb: float = 100):
     return get_cloud_options(tier.upper(), size_gb)
 
 @app.get("/api/alerts")
-async def get_alerts(severity: Optional[str] = None):
+async def get_alerts(request: Request, severity: Optional[str] = None):
     """Get system alerts"""
-    alerts = MOCK_DATA['alerts']
-    
-    if severity:
-        alerts = [a for a in alerts if a['severity'] == severity.lower()]
-    
-    return alerts
+    return _json_response(request, _alerts_json(severity.lower() if severity else None))
 
 @app.post("/api/alerts/{alert_id}/acknowledge")
 async def acknowledge_alert(alert_id: str):
     """Acknowledge an alert"""
-    for alert in MOCK_DATA['alerts']:
-        if alert['id'] == alert_id:
-            alert['acknowledged'] = True
-            return {"message": "Alert acknowledged", "alert_id": alert_id}
-    raise HTTPException(status_code=404, detail="Alert not found")
+    alert = _ALERT_BY_ID.get(alert_id)
+    if alert is None:
+        raise HTTPException(status_code=404, detail="Alert not found")
+    alert['acknowledged'] = True
+    _alerts_json.cache_clear()
+    _dashboard_json.cache_clear()
+    return {"message": "Alert acknowledged", "alert_id": alert_id}
 
 @app.get("/api/dashboard")
-async def get_dashboard_summary():
+async def get_dashboard_summary(request: Request):
     """Get dashboard overview data"""
-    
-    drives = MOCK_DATA['drives']
-    files = MOCK_DATA['files']
-    
-    # Calculate statistics
-    total_capacity = sum(d['capacity'] for d in drives)
-    total_used = sum(d['used'] for d in drives)
-    avg_health = sum(d['health_score'] for d in drives) / len(drives)
-    
-    critical_drives = sum(1 for d in drives if d['risk_level'] == 'CRITICAL')
-    high_risk_drives = sum(1 for d in drives if d['risk_level'] == 'HIGH')
-    
-    # Tier distribution
-    tier_counts = {}
-    tier_sizes = {}
-    for file in files:
-        tier = file['tier']
-        tier_counts[tier] = tier_counts.get(tier, 0) + 1
-        tier_sizes[tier] = tier_sizes.get(tier, 0) + file['size']
-    
-    # Recent alerts
-    unacknowledged_alerts = [a for a in MOCK_DATA['alerts'] if not a['acknowledged']]
-    
-    return {
-        "storage_summary": {
-            "total_capacity_gb": total_capacity,
-            "total_used_gb": total_used,
-            "utilization_percent": round(total_used / total_capacity * 100, 1),
-            "total_files": len(files)
-        },
-        "health_summary": {
-            "average_health_score": round(avg_health, 1),
-            "critical_drives": critical_drives,
-            "high_risk_drives": high_risk_drives,
-            "healthy_drives": len(drives) - critical_drives - high_risk_drives
-        },
-        "tier_distribution": {
-            tier: {
-                "files": count,
-                "size_gb": round(tier_sizes.get(tier, 0) / (1024**3), 2)
-            }
-            for tier, count in tier_counts.items()
-        },
-        "cost_summary": MOCK_DATA['cost_projections'],
-        "alerts": {
-            "total": len(unacknowledged_alerts),
-            "critical": sum(1 for a in unacknowledged_alerts if a['severity'] == 'critical'),
-            "high": sum(1 for a in unacknowledged_alerts if a['severity'] == 'high'),
-            "items": unacknowledged_alerts
-        }
-    }
+    return _json_response(request, _dashboard_json())
 
 @app.post("/api/apply-plan")
 async def apply_tiering_plan(plan_id: str = "default"):
@@ -723,51 +989,9 @@ async def apply_tiering_plan(plan_id: str = "default"):
     }
 
 @app.get("/api/export/lifecycle")
-async def export_lifecycle_policy(provider: str = "aws"):
+async def export_lifecycle_policy(request: Request, provider: str = "aws"):
     """Export S3 lifecycle policy JSON"""
-    
-    if provider.lower() == "aws":
-        policy = {
-            "Rules": [
-                {
-                    "ID": "GuardianDrive-HotToWarm",
-                    "Status": "Enabled",
-                    "Filter": {"Prefix": ""},
-                    "Transitions": [
-                        {
-                            "Days": 30,
-                            "StorageClass": "INTELLIGENT_TIERING"
-                        }
-                    ]
-                },
-                {
-                    "ID": "GuardianDrive-WarmToCold",
-                    "Status": "Enabled",
-                    "Filter": {"Prefix": "archive/"},
-                    "Transitions": [
-                        {
-                            "Days": 90,
-                            "StorageClass": "GLACIER_IR"
-                        }
-                    ]
-                },
-                {
-                    "ID": "GuardianDrive-ColdToDeep",
-                    "Status": "Enabled",
-                    "Filter": {"Prefix": "deep-archive/"},
-                    "Transitions": [
-                        {
-                            "Days": 365,
-                            "StorageClass": "DEEP_ARCHIVE"
-                        }
-                    ]
-                }
-            ]
-        }
-    else:
-        policy = {"message": f"Lifecycle policy for {provider} not yet implemented"}
-    
-    return policy
+    return _json_response(request, _lifecycle_json(provider))
 
 # ============================================================================
 # Startup
@@ -775,4 +999,12 @@ async def export_lifecycle_policy(provider: str = "aws"):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    
+    # Single worker: alert acknowledgements live in this process's MOCK_DATA
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if sys.platform != "win32" else "auto",  # uvloop has no Windows build
+        http="httptools"
+    )